@@ -1,7 +1,7 @@
-from flask import Blueprint, request, jsonify, current_app, render_template, send_file, Response
+from flask import Blueprint, request, jsonify, current_app, render_template, send_file
 import os
+from functools import lru_cache
 from io import BytesIO
-from datetime import datetime
 from PIL import Image, ImageOps
 import numpy as np
 
@@ -25,9 +25,9 @@ PORTRAIT_MODE = True
 
 def _create_palette_image():
     """Create palette image that PIL will strictly adhere to."""
-    # Create image with one pixel per color
-    palette_img = Image.new('P', (6, 1))
-    
+    # One pixel per color index - this forces PIL to use these indices
+    palette_img = Image.frombytes('P', (6, 1), bytes(range(6)))
+
     # Define the 6-color palette
     palette_data = [
         0, 0, 0,          # 0 = Black
@@ -37,14 +37,9 @@ def _create_palette_image():
         255, 0, 0,        # 4 = Red
         255, 255, 0,      # 5 = Yellow
     ] + [0] * (768 - 18)  # Pad to 256 colors
-    
+
     palette_img.putpalette(palette_data)
-    
-    # Put each color index in a pixel - this forces PIL to use these indices
-    pixels = palette_img.load()
-    for i in range(6):
-        pixels[i, 0] = i
-    
+
     return palette_img
 
 # Pre-create palette image at module load
@@ -66,15 +61,41 @@ def resize_and_dither_image(image_path):
 
 
 def convert_to_display_format(image_path):
-    """Convert image to 4bpp packed format using fast PIL quantize."""
+    """Convert image to 4bpp packed format (two palette indices per byte)."""
+    quantized = resize_and_dither_image(image_path)
+
+    # Pack pixel index pairs into single bytes without intermediate copies
+    pairs = np.asarray(quantized, dtype=np.uint8).reshape(-1, 2)
+    packed = np.empty(pairs.shape[0], dtype=np.uint8)
+    np.left_shift(pairs[:, 0], 4, out=packed)
+    packed |= pairs[:, 1]
+
+    return packed.tobytes()
+
+
+# The mtime is part of the cache key, so a newly written current_image.png
+# misses the cache and evicts the stale entry.
+@lru_cache(maxsize=1)
+def _packed_for(image_path, mtime):
+    """Return packed display bytes for image_path as of the given mtime."""
+    return convert_to_display_format(image_path)
+
+
+@lru_cache(maxsize=1)
+def _preview_png_for(image_path, mtime):
+    """Return dithered preview PNG bytes for image_path as of the given mtime."""
     quantized = resize_and_dither_image(image_path)
 
-    # Get pixel indices and pack
-    pixels = np.array(quantized, dtype=np.uint8)
-    flat = pixels.flatten()
-    packed = (flat[0::2] << 4) | flat[1::2]
+    # Save the palette image as an indexed PNG, browsers render it natively
+    buffer = BytesIO()
+    quantized.save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
+
 
-    return bytes(packed)
+def _not_modified(file_mtime):
+    """Return True if the request's If-Modified-Since covers file_mtime (whole seconds)."""
+    if_modified_since = request.if_modified_since
+    return bool(if_modified_since) and file_mtime <= int(if_modified_since.timestamp())
 
 
 @main_bp.route('/')
@@ -87,20 +108,20 @@ def preview_image():
     """Preview how the image will look after resize and dithering."""
     image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'images', 'current_image.png')
 
-    if not os.path.exists(image_path):
-        return jsonify({"error": "Image not found"}), 404
-
     try:
-        quantized = resize_and_dither_image(image_path)
-        # Convert palette image back to RGB for PNG output
-        rgb_image = quantized.convert('RGB')
+        mtime = os.stat(image_path).st_mtime
+    except FileNotFoundError:
+        return jsonify({"error": "Image not found"}), 404
 
-        # Save to bytes buffer
-        buffer = BytesIO()
-        rgb_image.save(buffer, format='PNG')
-        buffer.seek(0)
+    # Answer an unchanged image before dithering, a cache miss would otherwise pay for it
+    if _not_modified(int(mtime)):
+        return '', 304
 
-        return send_file(buffer, mimetype='image/png')
+    try:
+        # Encoded PNG bytes are cached per mtime
+        png_data = _preview_png_for(image_path, mtime)
+        return send_file(BytesIO(png_data), mimetype='image/png',
+                         last_modified=int(mtime), conditional=True, max_age=0)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -110,42 +131,31 @@ def get_current_image():
     """Serve current_image.png with conditional request support (If-Modified-Since)."""
     image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'images', 'current_image.png')
 
-    if not os.path.exists(image_path):
+    try:
+        mtime = os.stat(image_path).st_mtime
+    except FileNotFoundError:
         return jsonify({"error": "Image not found"}), 404
 
-    # Get the file's last modified time (truncate to seconds to match HTTP header precision)
-    file_mtime = int(os.path.getmtime(image_path))
-    last_modified = datetime.fromtimestamp(file_mtime)
-    # Check If-Modified-Since header
-    if_modified_since = request.headers.get('If-Modified-Since')
-    if if_modified_since:
-        try:
-            # Parse the If-Modified-Since header
-            client_mtime = datetime.strptime(if_modified_since, '%a, %d %b %Y %H:%M:%S %Z')
-            client_mtime_seconds = int(client_mtime.timestamp())
-             # Compare (both now in seconds, no sub-second precision)
-            if file_mtime <= client_mtime_seconds:
-                return '', 304
-        except (ValueError, AttributeError):
-            pass
+    # Truncate to seconds to match HTTP header precision
+    file_mtime = int(mtime)
+
+    # Answer an unchanged image before dithering, a cache miss would otherwise pay for it
+    if _not_modified(file_mtime):
+        return '', 304
 
     output_format = request.args.get('format', 'spectra6').lower()
 
     if output_format in ['raw', 'spectra6']:
         try:
-            packed_data = convert_to_display_format(image_path)
-            response = Response(packed_data, mimetype='application/octet-stream')
-            response.headers['Last-Modified'] = last_modified.strftime('%a, %d %b %Y %H:%M:%S GMT')
-            response.headers['Cache-Control'] = 'no-cache'
-            response.headers['Content-Length'] = len(packed_data)
-            return response
+            packed_data = _packed_for(image_path, mtime)
+            # send_file sets Last-Modified and handles the remaining conditional cases
+            return send_file(BytesIO(packed_data), mimetype='application/octet-stream',
+                             last_modified=file_mtime, conditional=True, max_age=0)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     else:
-        response = send_file(image_path, mimetype='image/png')
-        response.headers['Last-Modified'] = last_modified.strftime('%a, %d %b %Y %H:%M:%S GMT')
-        response.headers['Cache-Control'] = 'no-cache'
-        return response
+        return send_file(image_path, mimetype='image/png',
+                         last_modified=file_mtime, conditional=True, max_age=0)
 
 @main_bp.route('/api/plugin_order', methods=['POST'])
 def save_plugin_order():
@@ -1,10 +1,13 @@
 import logging
+import math
 import os
 import socket
 import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageOps
 from utils.image_utils import pad_image_blur
 
 logger = logging.getLogger(__name__)
@@ -41,14 +44,12 @@ FONTS = {
     "jost-semibold": "Jost-SemiBold.ttf"
 }
 
+# SRC_DIR is exported by the launcher before startup, default to the src directory
+_SRC_ROOT = Path(os.getenv("SRC_DIR") or os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@lru_cache(maxsize=256)
 def resolve_path(file_path):
-    src_dir = os.getenv("SRC_DIR")
-    if src_dir is None:
-        # Default to the src directory
-        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
-    src_path = Path(src_dir)
-    return str(src_path / file_path)
+    return str(_SRC_ROOT / file_path)
 
 def get_ip_address():
     with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
@@ -72,6 +73,8 @@ def is_connected():
     except OSError:
         return False
 
+# Fonts are immutable once loaded, so repeated requests share one FreeType face
+@lru_cache(maxsize=32)
 def get_font(font_name, font_size=50, font_weight="normal"):
     if font_name in FONT_FAMILIES:
         font_variants = FONT_FAMILIES[font_name]
@@ -143,10 +146,14 @@ def parse_form(request_form):
             request_dict[key] = request_form.getlist(key)
     return request_dict
 
+# Upper bound on images decoded and resized at once in handle_request_files
+MAX_UPLOAD_WORKERS = 2
+
 def handle_request_files(request_files, form_data={}, device_config=None):
     allowed_file_extensions = {'pdf', 'png', 'jpg', 'jpeg', 'gif', 'webp', 'heif', 'heic'}
     image_extensions = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'heif', 'heic'}
     file_location_map = {}
+    image_uploads = []
     # handle existing file locations being provided as part of the form data
     for key in set(request_files.keys()):
         is_list = key.endswith('[]')
@@ -168,22 +175,9 @@ def handle_request_files(request_files, form_data={}, device_config=None):
         file_save_dir = resolve_path(os.path.join("static", "images", "saved"))
         file_path = os.path.join(file_save_dir, file_name)
 
-        # Open the image and process it
         if extension.lower() in image_extensions:
-            try:
-                with Image.open(file) as img:
-                    # Apply EXIF transformation
-                    img = ImageOps.exif_transpose(img)
-
-                    # Apply resize and rotation if device_config is provided
-                    if device_config:
-                        border_percent = int(form_data.get("borderPercent", 0))
-                        img = _resize_and_rotate_image(img, device_config, border_percent)
-
-                    img.save(file_path)
-            except Exception as e:
-                logger.warning(f"Image processing error for {file_name}: {e}")
-                # file_path already has the raw upload saved above
+            # Images are processed together below
+            image_uploads.append((file, file_path))
         else:
             # Directly save non-image files (e.g., PDF)
             file.save(file_path)
@@ -193,41 +187,110 @@ def handle_request_files(request_files, form_data={}, device_config=None):
             file_location_map[key].append(file_path)
         else:
             file_location_map[key] = file_path
+
+    if image_uploads:
+        # Uploads sharing a basename map to one path, keep only the last like a serial save would
+        image_uploads = list({file_path: (file, file_path) for file, file_path in image_uploads}.values())
+        # PIL releases the GIL while decoding and resampling, so uploads resize in parallel.
+        # Each worker holds a full-resolution decode, so keep the pool small for the Pi's memory.
+        with ThreadPoolExecutor(max_workers=min(len(image_uploads), MAX_UPLOAD_WORKERS)) as executor:
+            list(executor.map(lambda upload: _process_image_upload(*upload, form_data, device_config), image_uploads))
+
     return file_location_map
 
 
-def _resize_and_rotate_image(image, device_config, border_percent=0):
+def _process_image_upload(file, file_path, form_data, device_config):
+    # Open the image and process it
+    try:
+        with Image.open(file) as img:
+            # Let libjpeg downscale while decoding, keeping 2x headroom for the resize
+            if device_config and img.format == "JPEG":
+                img.draft("RGB", _draft_size(img, device_config))
+
+            # Apply EXIF transformation
+            img = ImageOps.exif_transpose(img)
+
+            # Apply resize and rotation if device_config is provided
+            if device_config:
+                border_percent = int(form_data.get("borderPercent", 0))
+                background_color = None
+                if form_data.get("backgroundOption") == "color":
+                    background_color = ImageColor.getcolor(form_data.get("backgroundColor") or "white", "RGB")
+                img = _resize_and_rotate_image(img, device_config, border_percent, background_color)
+
+            img.save(file_path)
+    except Exception as e:
+        logger.warning(f"Image processing error for {os.path.basename(file_path)}: {e}")
+
+
+def _draft_size(image, device_config):
+    # Smallest decode size, in stored (pre-EXIF) orientation, that keeps 2x headroom
+    # over what _resize_and_rotate_image actually samples from the image.
+    width, height = device_config.get_resolution()
+    vertical = device_config.get_config("orientation") == "vertical"
+    if vertical:
+        width, height = height, width
+
+    image_width, image_height = image.size
+    # EXIF orientations 5-8 swap width and height when transposed
+    transposed = image.getexif().get(0x0112, 1) in (5, 6, 7, 8)
+    if transposed:
+        image_width, image_height = image_height, image_width
+
+    if vertical and image_width > image_height:
+        # Landscape image in portrait mode is contained, not cropped to cover
+        scale = min(width / image_width, height / image_height)
+    else:
+        scale = max(width / image_width, height / image_height)
+
+    draft_width = math.ceil(image_width * scale * 2)
+    draft_height = math.ceil(image_height * scale * 2)
+    if transposed:
+        draft_width, draft_height = draft_height, draft_width
+    return (draft_width, draft_height)
+
+
+def _resize_and_rotate_image(image, device_config, border_percent=0, background_color=None):
     # Resize and rotate image based on device configuration.
+    # Landscape images in portrait mode are padded with background_color bars,
+    # or with a blurred background when it is None.
     orientation = device_config.get_config("orientation")
     display_size = device_config.get_resolution()
 
     if orientation == "vertical":
+        # For portrait mode: lay out on the portrait canvas, rotate for display last
         target_size = (display_size[1], display_size[0])
-        # For portrait mode: resize then rotate for display
-        if image.width > image.height:
-            # Landscape image in portrait mode: pad with blurred background
-            fitted_img = pad_image_blur(image, target_size)
-            image = fitted_img.rotate(90, expand=True)
+    else:
+        target_size = display_size
+
+    # Fit straight to the bordered size so the image is only resampled once
+    inner_size = target_size
+    if border_percent > 0:
+        shrink_factor = 1 - (border_percent / 100)
+        inner_size = (int(target_size[0] * shrink_factor), int(target_size[1] * shrink_factor))
+
+    if orientation == "vertical" and image.width > image.height:
+        if background_color is not None:
+            # Landscape image in portrait mode: letterbox with solid bars, skipping the blur
+            fitted_img = ImageOps.contain(image, inner_size, Image.Resampling.LANCZOS)
+            image = Image.new("RGB", inner_size, background_color)
+            image.paste(fitted_img, ((inner_size[0] - fitted_img.width) // 2, (inner_size[1] - fitted_img.height) // 2))
         else:
-            fitted_img = ImageOps.fit(image, target_size, Image.Resampling.LANCZOS)
-            image = fitted_img.rotate(90, expand=True)
+            # Landscape image in portrait mode: pad with blurred background
+            image = pad_image_blur(image, inner_size)
     else:
-        # Landscape mode: just resize to display dimensions
-        image = ImageOps.fit(image, display_size, Image.Resampling.LANCZOS)
+        image = ImageOps.fit(image, inner_size, Image.Resampling.LANCZOS)
 
     # Apply border if border_percent > 0
     if border_percent > 0:
-        canvas_size = image.size
-        shrink_factor = 1 - (border_percent / 100)
-        new_width = int(canvas_size[0] * shrink_factor)
-        new_height = int(canvas_size[1] * shrink_factor)
-        shrunk_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-        # Create white canvas and paste shrunk image centered
-        white_canvas = Image.new("RGB", canvas_size, (255, 255, 255))
-        paste_x = (canvas_size[0] - new_width) // 2
-        paste_y = (canvas_size[1] - new_height) // 2
-        white_canvas.paste(shrunk_image, (paste_x, paste_y))
+        # Create white canvas and paste fitted image centered
+        white_canvas = Image.new("RGB", target_size, (255, 255, 255))
+        paste_x = (target_size[0] - inner_size[0]) // 2
+        paste_y = (target_size[1] - inner_size[1]) // 2
+        white_canvas.paste(image, (paste_x, paste_y))
         image = white_canvas
 
-    return image
\ No newline at end of file
+    if orientation == "vertical":
+        image = image.rotate(90, expand=True)
+
+    return image
@@ -0,0 +1,123 @@
+import io
+import os
+import sys
+
+import pytest
+from PIL import Image
+from werkzeug.datastructures import FileStorage, MultiDict
+
+# app_utils imports its siblings as top-level "utils" modules, like the app does
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+from utils import app_utils
+from utils.app_utils import _draft_size, _resize_and_rotate_image, handle_request_files
+
+
+class FakeDeviceConfig:
+
+    def __init__(self, orientation, resolution=(800, 480)):
+        self.orientation = orientation
+        self.resolution = resolution
+
+    def get_config(self, key):
+        return {"orientation": self.orientation}[key]
+
+    def get_resolution(self):
+        return self.resolution
+
+
+def open_jpeg(size, exif_orientation=1):
+    exif = Image.Exif()
+    exif[0x0112] = exif_orientation
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (0, 128, 255)).save(buffer, format="JPEG", exif=exif)
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+class TestDraftSize:
+
+    @pytest.mark.parametrize(
+        "orientation,exif_orientation,expected",
+        [
+            # Landscape photo on a landscape display: cover 800x480
+            ("horizontal", 1, (1600, 1200)),
+            # Landscape photo on a portrait display: contained in 480x800
+            ("vertical", 1, (960, 720)),
+            # Stored landscape, shown as portrait (3000x4000): cover 800x480
+            ("horizontal", 6, (2134, 1600)),
+            # Stored landscape, shown as portrait (3000x4000): cover 480x800
+            ("vertical", 6, (1600, 1200)),
+        ],
+    )
+    def test_draft_size(self, orientation, exif_orientation, expected):
+        with open_jpeg((4000, 3000), exif_orientation) as image:
+            assert _draft_size(image, FakeDeviceConfig(orientation)) == expected
+
+    def test_draft_downscales_landscape_photo_on_portrait_display(self):
+        with open_jpeg((2000, 1500)) as image:
+            image.draft("RGB", _draft_size(image, FakeDeviceConfig("vertical")))
+            assert image.size == (1000, 750)
+
+
+class TestResizeAndRotateImage:
+
+    @pytest.mark.parametrize("color", [(255, 255, 255), (0, 0, 0)])
+    def test_color_bars_letterbox_landscape_image_in_portrait(self, color):
+        image = Image.new("RGB", (1600, 900), (255, 0, 0))
+        result = _resize_and_rotate_image(image, FakeDeviceConfig("vertical"), background_color=color)
+
+        assert result.size == (800, 480)
+        # The portrait canvas is rotated, so the bars end up left and right
+        assert result.getpixel((5, 240)) == color
+        assert result.getpixel((794, 240)) == color
+        assert result.getpixel((400, 240)) == (255, 0, 0)
+        assert result.getpixel((400, 5)) == (255, 0, 0)
+
+    def test_landscape_mode_ignores_background_color(self):
+        image = Image.new("RGB", (1600, 900), (255, 0, 0))
+        result = _resize_and_rotate_image(image, FakeDeviceConfig("horizontal"), background_color=(0, 0, 0))
+
+        assert result.size == (800, 480)
+        assert result.getpixel((5, 240)) == (255, 0, 0)
+
+
+class TestHandleRequestFiles:
+
+    @pytest.fixture
+    def save_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(app_utils, "_SRC_ROOT", tmp_path)
+        app_utils.resolve_path.cache_clear()
+        save_dir = tmp_path / "static" / "images" / "saved"
+        save_dir.mkdir(parents=True)
+        yield save_dir
+        app_utils.resolve_path.cache_clear()
+
+    def test_duplicate_basenames_keep_last_upload(self, save_dir):
+        uploads = []
+        for color in [(255, 0, 0), (0, 0, 255)]:
+            buffer = io.BytesIO()
+            Image.new("RGB", (1600, 960), color).save(buffer, format="PNG")
+            buffer.seek(0)
+            uploads.append(("imageFiles[]", FileStorage(buffer, filename="IMG_0001.png")))
+
+        locations = handle_request_files(MultiDict(uploads), MultiDict(), FakeDeviceConfig("horizontal"))
+
+        saved_path = str(save_dir / "IMG_0001.png")
+        assert locations["imageFiles[]"] == [saved_path, saved_path]
+        with Image.open(saved_path) as saved:
+            assert saved.size == (800, 480)
+            assert saved.getpixel((400, 240)) == (0, 0, 255)
+
+    def test_color_background_option_pads_with_chosen_color(self, save_dir):
+        buffer = io.BytesIO()
+        Image.new("RGB", (1600, 900), (255, 0, 0)).save(buffer, format="PNG")
+        buffer.seek(0)
+        form = MultiDict({"backgroundOption": "color", "backgroundColor": "#000000"})
+
+        locations = handle_request_files(
+            MultiDict([("imageFiles[]", FileStorage(buffer, filename="wide.png"))]), form, FakeDeviceConfig("vertical"))
+
+        with Image.open(locations["imageFiles[]"][0]) as saved:
+            assert saved.size == (800, 480)
+            assert saved.getpixel((5, 240)) == (0, 0, 0)
+            assert saved.getpixel((400, 240)) == (255, 0, 0)